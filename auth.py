@@ -0,0 +1,30 @@
+from functools import lru_cache
+import google.auth
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+
+@lru_cache(maxsize=None)
+def get_credentials() -> Credentials:
+    """
+    Resolve Application Default Credentials once and share them between all helper clients.
+
+    Returns:
+        Credentials: Google auth credentials scoped to cloud-platform.
+    """
+    credentials, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+    return credentials
+
+
+@lru_cache(maxsize=None)
+def get_authorized_session() -> AuthorizedSession:
+    """
+    Build one authorized HTTP session whose connection pool is shared by all REST based helper clients.
+
+    Returns:
+        AuthorizedSession: A requests session that attaches the shared credentials to every request.
+    """
+    session = AuthorizedSession(get_credentials())
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    return session
@@ -1,4 +1,136 @@
 from google.cloud import bigquery
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types, writer
+from google.api_core.exceptions import GoogleAPICallError
+from google.protobuf import descriptor_pb2, descriptor_pool, json_format, message_factory
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import RLock
+from cachetools import TTLCache
+from typing import List, Dict, Any
+import io, json
+import pandas as pd
+import pyarrow as pa
+from auth import get_credentials, get_authorized_session
+
+# Storage Write API requests are capped at 10 MB, leave headroom for the request envelope
+_MAX_APPEND_BYTES = 9 * 1024 * 1024
+
+_PROTO_TYPES = {
+    "STRING": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+    "BYTES": descriptor_pb2.FieldDescriptorProto.TYPE_BYTES,
+    "INTEGER": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "INT64": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "FLOAT": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "FLOAT64": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "BOOLEAN": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    "BOOL": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    "TIMESTAMP": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+}
+
+
+def _timestamp_to_micros(value: Any) -> int:
+    """
+    Convert a TIMESTAMP value accepted by insert_rows_json (epoch seconds, ISO string or datetime) to epoch microseconds.
+
+    Args:
+        value (Any): The timestamp value.
+
+    Returns:
+        int: Microseconds since the Unix epoch.
+    """
+    if isinstance(value, (int, float)):
+        return round(value * 1_000_000)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith(" UTC"):
+            text = text[:-4]
+        elif text.endswith("Z"):
+            text = text[:-1]
+        value = datetime.fromisoformat(text)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _coerce_row(row: Dict[str, Any], schema: List[bigquery.SchemaField]) -> Dict[str, Any]:
+    """
+    Convert a JSON row to the value types expected by the descriptor from _schema_to_descriptor.
+    NUMERIC, DATE, JSON and similar columns are sent as strings, TIMESTAMP columns as epoch microseconds.
+
+    Args:
+        row (Dict[str, Any]): The row to convert.
+        schema (List[bigquery.SchemaField]): The schema of the table.
+
+    Returns:
+        Dict[str, Any]: The converted row.
+    """
+    fields = {field.name: field for field in schema}
+    coerced = {}
+    for name, value in row.items():
+        field = fields.get(name)
+        if field is None or value is None:
+            coerced[name] = value
+        elif field.mode == "REPEATED":
+            coerced[name] = [_coerce_value(field, item) for item in value]
+        else:
+            coerced[name] = _coerce_value(field, value)
+    return coerced
+
+
+def _coerce_value(field: bigquery.SchemaField, value: Any) -> Any:
+    """
+    Convert a single column value, see _coerce_row.
+
+    Args:
+        field (bigquery.SchemaField): The schema of the column.
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The converted value.
+    """
+    if field.field_type in ("RECORD", "STRUCT"):
+        return _coerce_row(value, field.fields)
+    if field.field_type == "TIMESTAMP":
+        return _timestamp_to_micros(value)
+    if field.field_type == "JSON" and not isinstance(value, str):
+        return json.dumps(value)
+    if field.field_type not in _PROTO_TYPES and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _schema_to_descriptor(schema: List[bigquery.SchemaField], name: str) -> descriptor_pb2.DescriptorProto:
+    """
+    Build a self-contained proto2 message descriptor matching a BigQuery table schema.
+    TIMESTAMP is sent as int64 epoch microseconds and types without a native proto equivalent
+    (NUMERIC, DATE, DATETIME, JSON etc.) as strings, see _coerce_row.
+
+    Args:
+        schema (List[bigquery.SchemaField]): The schema of the table.
+        name (str): The name of the message type.
+
+    Returns:
+        descriptor_pb2.DescriptorProto: The message descriptor.
+    """
+    message = descriptor_pb2.DescriptorProto(name=name)
+    for number, field in enumerate(schema, start=1):
+        field_proto = message.field.add(name=field.name, number=number)
+        if field.mode == "REPEATED":
+            field_proto.label = descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED
+        elif field.mode == "REQUIRED":
+            field_proto.label = descriptor_pb2.FieldDescriptorProto.LABEL_REQUIRED
+        else:
+            field_proto.label = descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+        if field.field_type in ("RECORD", "STRUCT"):
+            nested = _schema_to_descriptor(field.fields, f"{field.name}_{number}")
+            message.nested_type.append(nested)
+            field_proto.type = descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE
+            field_proto.type_name = nested.name
+        else:
+            field_proto.type = _PROTO_TYPES.get(field.field_type, descriptor_pb2.FieldDescriptorProto.TYPE_STRING)
+    return message
 
 class BigQueryClientHelper:
     def __init__(self, project_id: str):
@@ -9,7 +141,67 @@ class BigQueryClientHelper:
             project_id (str): The Google Cloud project ID.
         """
         self.project_id = project_id
-        self.client = bigquery.Client(project_id=project_id)
+        self.client = bigquery.Client(project=project_id, credentials=get_credentials(), _http=get_authorized_session())
+        self._table_cache = TTLCache(maxsize=1024, ttl=300)
+        self._lock = RLock()
+        self._write_client = None
+        self._read_client = None
+
+    def _get_table(self, table_id: str) -> bigquery.Table:
+        """
+        Fetch table metadata, reusing a cached copy for up to five minutes.
+
+        Args:
+            table_id (str): The fully qualified table ID.
+
+        Returns:
+            bigquery.Table: The table object.
+        """
+        with self._lock:
+            table = self._table_cache.get(table_id)
+        if table is None:
+            # Fetch outside the lock so one slow lookup does not block others; a duplicate fetch on a race is harmless
+            table = self.client.get_table(table_id)
+            with self._lock:
+                self._table_cache[table_id] = table
+        return table
+
+    def _get_write_client(self) -> bigquery_storage_v1.BigQueryWriteClient:
+        """
+        Get the Storage Write API client, creating it on first use.
+
+        Returns:
+            bigquery_storage_v1.BigQueryWriteClient: The write client.
+        """
+        with self._lock:
+            if self._write_client is None:
+                self._write_client = bigquery_storage_v1.BigQueryWriteClient(credentials=get_credentials())
+            return self._write_client
+
+    def _get_read_client(self) -> bigquery_storage_v1.BigQueryReadClient:
+        """
+        Get the Storage Read API client, creating it on first use.
+
+        Returns:
+            bigquery_storage_v1.BigQueryReadClient: The read client.
+        """
+        with self._lock:
+            if self._read_client is None:
+                self._read_client = bigquery_storage_v1.BigQueryReadClient(credentials=get_credentials())
+            return self._read_client
+
+    def _invalidate_table(self, table_id: str) -> None:
+        """
+        Drop a table from the metadata cache.
+
+        Args:
+            table_id (str): The fully qualified table ID.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._table_cache.pop(table_id, None)
     
     def create_dataset(self, dataset_id: str) -> object:
         """
@@ -36,10 +228,16 @@ class BigQueryClientHelper:
             None
         """
         self.client.delete_dataset(dataset_id, delete_contents=delete_contents, not_found_ok=True)
+        dataset_ref = bigquery.DatasetReference.from_string(dataset_id, default_project=self.project_id)
+        prefix = f"{dataset_ref.project}.{dataset_ref.dataset_id}."
+        with self._lock:
+            for table_id in [table_id for table_id in self._table_cache if table_id.startswith(prefix)]:
+                self._table_cache.pop(table_id, None)
 
     def query_to_dataframe(self, query: str) -> pd.DataFrame:
         """
         Execute a SQL query in initialised project and return the results as a pandas DataFrame.
+        Results are downloaded as Arrow record batches through the BigQuery Storage Read API.
 
         Args:
             query (str): The SQL query to execute.
@@ -48,25 +246,185 @@ class BigQueryClientHelper:
             pd.DataFrame: A DataFrame containing the query results.
         """
         query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        return query_job.to_dataframe(bqstorage_client=self._get_read_client(), create_bqstorage_client=False)
 
-    def insert_data(self, dataset_name: str, table_name: str, rows: List[Dict[str, Any]]) -> None:
+    def query_to_arrow(self, query: str) -> pa.Table:
+        """
+        Execute a SQL query in initialised project and return the results as a pyarrow Table.
+        Results are downloaded through the BigQuery Storage Read API and skip the conversion to pandas.
+
+        Args:
+            query (str): The SQL query to execute.
+
+        Returns:
+            pa.Table: A pyarrow Table containing the query results.
+        """
+        query_job = self.client.query(query)
+        return query_job.to_arrow(bqstorage_client=self._get_read_client(), create_bqstorage_client=False)
+
+    def insert_data(self,
+                    dataset_name: str,
+                    table_name: str,
+                    rows: List[Dict[str, Any]],
+                    chunk_size: int = 500,
+                    max_workers: int = 8,
+                    method: str = "auto",
+                    load_threshold: int = 10_000) -> None:
         """
         Insert rows into a BigQuery table that already exists within initialised project.
+        Rows are streamed in chunks of chunk_size, with up to max_workers chunks in flight at once.
+        Tune max_workers to stay below the project's streaming insert quota.
+        With method "auto", inputs of at least load_threshold rows are written with a batch load job instead (see bulk_load).
+        The Storage Write API is only used when method is "storage_write" (see insert_data_storage_write).
 
         Args:
             dataset_name (str): The name of the dataset where the table sits.
             table_name (str): The name of the table to insert data into.
             rows (List[Dict[str, Any]]): A list of dictionaries representing the rows to insert.
+            chunk_size (int, optional): The number of rows sent per streaming insert request.
+            max_workers (int, optional): The maximum number of concurrent streaming insert requests.
+            method (str, optional): "stream", "storage_write", "load" or "auto" to choose between stream and load by the number of rows.
+            load_threshold (int, optional): The number of rows at which "auto" switches to a batch load job.
 
         Returns:
             None
         """
+        if method not in ("auto", "stream", "storage_write", "load"):
+            raise ValueError(f"Unknown insert method: {method}")
+        if method == "load" or (method == "auto" and len(rows) >= load_threshold):
+            self.bulk_load(dataset_name, table_name, rows)
+            return
+        if method == "storage_write":
+            self.insert_data_storage_write(dataset_name, table_name, rows)
+            return
+
         table_id = f"{self.project_id}.{dataset_name}.{table_name}"
-        errors = self.client.insert_rows_json(table_id, rows)
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.client.insert_rows_json, table_id, rows[start:start + chunk_size], skip_invalid_rows=False): start
+                for start in range(0, len(rows), chunk_size)
+            }
+            for future in as_completed(futures):
+                start = futures[future]
+                try:
+                    chunk_errors = future.result()
+                except Exception as e:
+                    # The whole chunk failed; record it and keep collecting the other chunks' results
+                    count = min(chunk_size, len(rows) - start)
+                    errors.append({"index": start, "count": count, "message": str(e)})
+                    continue
+                for error in chunk_errors:
+                    errors.append({**error, "index": error["index"] + start})
+        if errors:
+            errors.sort(key=lambda error: error["index"])
+            raise Exception(f"Failed to insert rows: {errors}")
+
+    def insert_data_storage_write(self, dataset_name: str, table_name: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert rows into a BigQuery table that already exists within initialised project using the Storage Write API.
+        Rows are encoded as protobuf against the table schema and appended to the table's default stream
+        over a single gRPC connection, in requests of up to 10 MB.
+
+        Args:
+            dataset_name (str): The name of the dataset where the table sits.
+            table_name (str): The name of the table to insert data into.
+            rows (List[Dict[str, Any]]): A list of dictionaries representing the rows to insert.
+
+        Returns:
+            None
+        """
+        table = self._get_table(f"{self.project_id}.{dataset_name}.{table_name}")
+        proto_descriptor = _schema_to_descriptor(table.schema, "Row")
+        pool = descriptor_pool.DescriptorPool()
+        pool.Add(descriptor_pb2.FileDescriptorProto(name="row.proto", syntax="proto2", message_type=[proto_descriptor]))
+        row_class = message_factory.GetMessageClass(pool.FindMessageTypeByName("Row"))
+
+        # Encode every row before opening the stream, so a bad row fails the call before anything is committed
+        batches = []
+        batch, batch_bytes, batch_start = [], 0, 0
+        for index, row in enumerate(rows):
+            serialized = json_format.ParseDict(_coerce_row(row, table.schema), row_class()).SerializeToString()
+            if batch and batch_bytes + len(serialized) > _MAX_APPEND_BYTES:
+                batches.append((batch_start, batch))
+                batch, batch_bytes, batch_start = [], 0, index
+            batch.append(serialized)
+            batch_bytes += len(serialized)
+        if batch:
+            batches.append((batch_start, batch))
+
+        write_client = self._get_write_client()
+        request_template = types.AppendRowsRequest(
+            write_stream=f"{write_client.table_path(self.project_id, dataset_name, table_name)}/streams/_default",
+            proto_rows=types.AppendRowsRequest.ProtoData(writer_schema=types.ProtoSchema(proto_descriptor=proto_descriptor)),
+        )
+        append_rows_stream = writer.AppendRowsStream(write_client, request_template)
+        errors = []
+        try:
+            futures = []
+            for start, serialized_rows in batches:
+                try:
+                    futures.append((start, append_rows_stream.send(self._append_rows_request(serialized_rows))))
+                except Exception as e:
+                    errors.append({"index": start, "message": str(e)})
+                    break
+            # Row errors arrive as exceptions on the future; wait on every batch before reporting
+            for start, future in futures:
+                try:
+                    future.result()
+                except GoogleAPICallError as e:
+                    response = getattr(e, "response", None)
+                    row_errors = list(response.row_errors) if response is not None else []
+                    if not row_errors:
+                        errors.append({"index": start, "message": str(e)})
+                    for row_error in row_errors:
+                        errors.append({"index": start + row_error.index, "message": row_error.message})
+                except Exception as e:
+                    errors.append({"index": start, "message": str(e)})
+        finally:
+            append_rows_stream.close()
         if errors:
             raise Exception(f"Failed to insert rows: {errors}")
 
+    def _append_rows_request(self, serialized_rows: List[bytes]) -> types.AppendRowsRequest:
+        """
+        Wrap serialized protobuf rows in an append request.
+
+        Args:
+            serialized_rows (List[bytes]): The serialized rows.
+
+        Returns:
+            types.AppendRowsRequest: The append request.
+        """
+        proto_rows = types.ProtoRows(serialized_rows=serialized_rows)
+        return types.AppendRowsRequest(proto_rows=types.AppendRowsRequest.ProtoData(rows=proto_rows))
+
+    def bulk_load(self, dataset_name: str, table_name: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Append rows to a BigQuery table within initialised project using a batch load job.
+        Rows are uploaded as newline delimited JSON in a single request, which is cheaper than streaming for large inputs.
+
+        Args:
+            dataset_name (str): The name of the dataset where the table sits.
+            table_name (str): The name of the table to load data into.
+            rows (List[Dict[str, Any]]): A list of dictionaries representing the rows to load.
+
+        Returns:
+            None
+        """
+        table_id = f"{self.project_id}.{dataset_name}.{table_name}"
+        buffer = io.BytesIO()
+        for row in rows:
+            buffer.write(json.dumps(row).encode("utf-8"))
+            buffer.write(b"\n")
+        buffer.seek(0)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+        load_job = self.client.load_table_from_file(buffer, table_id, job_config=job_config)
+        load_job.result()
+
     def create_table(self,
                     dataset_name: str,
                     table_name: str, 
@@ -94,6 +452,19 @@ class BigQueryClientHelper:
             table.clustering_fields = cluster_fields
         return self.client.create_table(table, exists_ok=True)
 
+    def get_table(self, dataset_name: str, table_name: str) -> bigquery.Table:
+        """
+        Get a table in BigQuery in initialised project. Metadata is cached for five minutes.
+
+        Args:
+            dataset_name (str): The name of the dataset where the table sits.
+            table_name (str): The name of the table to get.
+
+        Returns:
+            bigquery.Table: The table object.
+        """
+        return self._get_table(f"{self.project_id}.{dataset_name}.{table_name}")
+
     def delete_table(self, dataset_name: str, table_name: str) -> None:
         """
         Delete a table in BigQuery in initialised project.
@@ -105,7 +476,9 @@ class BigQueryClientHelper:
         Returns:
             None
         """
-        self.client.delete_table(f"{self.project_id}.{dataset_name}.{table_name}", not_found_ok=True)
+        table_id = f"{self.project_id}.{dataset_name}.{table_name}"
+        self.client.delete_table(table_id, not_found_ok=True)
+        self._invalidate_table(table_id)
 
     def create_view(self, dataset_name: str, view_name: str, query: str) -> None:
         """
@@ -137,4 +510,5 @@ class BigQueryClientHelper:
         """
         view_id = f"{self.project_id}.{dataset_name}.{view_name}"
         self.client.delete_table(view_id, not_found_ok=True)
+        self._invalidate_table(view_id)
     
\ No newline at end of file
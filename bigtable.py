@@ -1,6 +1,7 @@
 from google.cloud import bigtable
 from google.cloud.bigtable import column_family
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
+from auth import get_credentials
 
 class BigtableClientHelper:
     def __init__(self, project_id: str):
@@ -14,7 +15,40 @@ class BigtableClientHelper:
         Returns:
             None
         """
-        self.client = bigtable.Client(project=project_id, admin=True)
+        self.client = bigtable.Client(project=project_id, credentials=get_credentials(), admin=True)
+        self._instances: Dict[str, bigtable.Instance] = {}
+        self._tables: Dict[Tuple[str, str], bigtable.Table] = {}
+
+    def _instance(self, instance_id: str) -> bigtable.Instance:
+        """
+        Get the Instance handle for an instance ID, reusing it across calls.
+
+        Args:
+            instance_id (str): The Bigtable instance ID.
+
+        Returns:
+            bigtable.Instance: The instance object.
+        """
+        instance = self._instances.get(instance_id)
+        if instance is None:
+            instance = self._instances.setdefault(instance_id, self.client.instance(instance_id))
+        return instance
+
+    def _table(self, instance_id: str, table_id: str) -> bigtable.Table:
+        """
+        Get the Table handle for a table in an instance, reusing it across calls.
+
+        Args:
+            instance_id (str): The Bigtable instance ID.
+            table_id (str): The ID of the table.
+
+        Returns:
+            bigtable.Table: The table object.
+        """
+        table = self._tables.get((instance_id, table_id))
+        if table is None:
+            table = self._tables.setdefault((instance_id, table_id), self._instance(instance_id).table(table_id))
+        return table
 
     def create_instance(self, instance_id: str, cluster_id: str, location_id: str, serve_nodes: int) -> bigtable.Instance:
         """
@@ -29,7 +63,7 @@ class BigtableClientHelper:
         Returns:
             bigtable.Instance: The created instance object.
         """
-        instance = self.client.instance(instance_id)
+        instance = self._instance(instance_id)
         cluster = instance.cluster(cluster_id, location_id=location_id, serve_nodes=serve_nodes)
         instance.create(clusters=[cluster])
         return instance
@@ -44,8 +78,10 @@ class BigtableClientHelper:
         Returns:
             None
         """
-        instance = self.client.instance(instance_id)
-        instance.delete()
+        self._instance(instance_id).delete()
+        self._instances.pop(instance_id, None)
+        for key in [key for key in self._tables if key[0] == instance_id]:
+            self._tables.pop(key, None)
 
     def create_table(self, instance_id: str, table_id: str, column_family_id: str) -> bigtable.Table:
         """
@@ -59,8 +95,7 @@ class BigtableClientHelper:
         Returns:
             bigtable.Table: The created table object.
         """
-        instance = self.client.instance(instance_id)
-        table = instance.table(table_id)
+        table = self._table(instance_id, table_id)
         column_family = table.column_family(column_family_id)
         table.create(column_families={column_family_id: column_family})
         return table
@@ -76,9 +111,8 @@ class BigtableClientHelper:
         Returns:
             None
         """
-        instance = self.client.instance(instance_id)
-        table = instance.table(table_id)
-        table.delete()
+        self._table(instance_id, table_id).delete()
+        self._tables.pop((instance_id, table_id), None)
 
     def write_row(self, instance_id: str, table_id: str, row_key: str, column_family_id: str, column: str, value: str) -> None:
         """
@@ -95,12 +129,39 @@ class BigtableClientHelper:
         Returns:
             None
         """
-        instance = self.client.instance(instance_id)
-        table = instance.table(table_id)
+        table = self._table(instance_id, table_id)
         row = table.direct_row(row_key)
         row.set_cell(column_family_id, column, value)
         row.commit()
 
+    def write_rows(self, instance_id: str, table_id: str, rows: List[Tuple[str, str, str, str]], batch_size: int = 1000) -> None:
+        """
+        Write many rows to a table in a specified Bigtable instance, sending them in batches with mutate_rows.
+
+        Args:
+            instance_id (str): The Bigtable instance ID.
+            table_id (str): The ID of the table.
+            rows (List[Tuple[str, str, str, str]]): (row_key, column_family_id, column, value) tuples to write.
+            batch_size (int, optional): The number of rows sent per mutate_rows call.
+
+        Returns:
+            None
+        """
+        table = self._table(instance_id, table_id)
+        errors = []
+        for start in range(0, len(rows), batch_size):
+            batch = []
+            for row_key, column_family_id, column, value in rows[start:start + batch_size]:
+                row = table.direct_row(row_key)
+                row.set_cell(column_family_id, column, value)
+                batch.append(row)
+            statuses = table.mutate_rows(batch)
+            for row, status in zip(batch, statuses):
+                if status.code != 0:
+                    errors.append({"row_key": row.row_key, "code": status.code, "message": status.message})
+        if errors:
+            raise Exception(f"Failed to write rows: {errors}")
+
     def read_row(self, instance_id: str, table_id: str, row_key: str) -> Dict[str, Any]:
         """
         Read a row from a table in the specified Bigtable instance.
@@ -113,8 +174,7 @@ class BigtableClientHelper:
         Returns:
             Dict[str, Any]: The row data.
         """
-        instance = self.client.instance(instance_id)
-        table = instance.table(table_id)
+        table = self._table(instance_id, table_id)
         row = table.read_row(row_key)
         return row.to_dict() if row else {}
 
@@ -128,6 +188,18 @@ class BigtableClientHelper:
         Returns:
             List[str]: A list of table IDs.
         """
-        instance = self.client.instance(instance_id)
-        tables = instance.list_tables()
-        return [table.table_id for table in tables]
\ No newline at end of file
+        return list(self.iter_tables(instance_id))
+
+    def iter_tables(self, instance_id: str) -> Iterator[str]:
+        """
+        Iterate over all tables in the specified Bigtable instance.
+
+        Args:
+            instance_id (str): The Bigtable instance ID.
+
+        Returns:
+            Iterator[str]: An iterator of table IDs.
+        """
+        instance = self._instance(instance_id)
+        for table in instance.list_tables():
+            yield table.table_id
@@ -1,5 +1,35 @@
 from kubernetes import client, config
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+import json
+
+# Asks the API server for object metadata only, instead of the full object
+_PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+
+def _model_to_dict(obj: Any) -> Any:
+    """
+    Convert a Kubernetes client model to a dictionary, leaving out fields that are None.
+    Lighter than the generated to_dict(), which keeps every unset field of large specs.
+
+    Args:
+        obj (Any): A Kubernetes model, or a list, dict or plain value inside one.
+
+    Returns:
+        Any: The converted value.
+    """
+    if isinstance(obj, list):
+        return [_model_to_dict(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _model_to_dict(value) for key, value in obj.items()}
+    openapi_types = getattr(obj, "openapi_types", None)
+    if openapi_types is None:
+        return obj
+    result = {}
+    for attr in openapi_types:
+        value = getattr(obj, attr)
+        if value is not None:
+            result[attr] = _model_to_dict(value)
+    return result
 
 class KubernetesClientHelper:
     def __init__(self, kubeconfig_path: str = None):
@@ -19,18 +49,100 @@ class KubernetesClientHelper:
         self.v1 = client.CoreV1Api()
         self.apps_v1 = client.AppsV1Api()
 
-    def list_pods(self, namespace: str = 'default') -> List[Dict[str, Any]]:
+    def list_pods(self,
+                  namespace: str = 'default',
+                  label_selector: str = None,
+                  field_selector: str = None,
+                  metadata_only: bool = False) -> List[Dict[str, Any]]:
         """
-        List all pods in a namespace.
+        List all pods in a namespace, optionally filtered by label and field selectors.
 
         Args:
             namespace (str): The namespace to list pods from.
+            label_selector (str, optional): Only return pods matching this label selector, e.g. "app=web".
+            field_selector (str, optional): Only return pods matching this field selector, e.g. "status.phase=Running".
+            metadata_only (bool, optional): Only fetch each pod's metadata (see iter_pods).
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries representing the pods.
         """
-        pods = self.v1.list_namespaced_pod(namespace)
-        return [pod.to_dict() for pod in pods.items]
+        return list(self.iter_pods(namespace, label_selector=label_selector, field_selector=field_selector, metadata_only=metadata_only))
+
+    def iter_pods(self,
+                  namespace: str = 'default',
+                  label_selector: str = None,
+                  field_selector: str = None,
+                  limit: int = 500,
+                  metadata_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all pods in a namespace, requesting them from the API server one page at a time.
+        Selectors are applied server side. With metadata_only the server returns PartialObjectMetadata,
+        yielded as raw API dictionaries (camelCase keys) containing only "metadata".
+
+        Args:
+            namespace (str): The namespace to list pods from.
+            label_selector (str, optional): Only return pods matching this label selector, e.g. "app=web".
+            field_selector (str, optional): Only return pods matching this field selector, e.g. "status.phase=Running".
+            limit (int): The maximum number of pods to request per page.
+            metadata_only (bool, optional): Only fetch each pod's metadata.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of dictionaries representing the pods.
+        """
+        if metadata_only:
+            yield from self._iter_partial_metadata(f"/api/v1/namespaces/{namespace}/pods", label_selector, field_selector, limit)
+            return
+        continue_token = None
+        while True:
+            pods = self.v1.list_namespaced_pod(
+                namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                limit=limit,
+                _continue=continue_token,
+            )
+            for pod in pods.items:
+                yield _model_to_dict(pod)
+            continue_token = pods.metadata._continue
+            if not continue_token:
+                break
+
+    def _iter_partial_metadata(self, path: str, label_selector: str, field_selector: str, limit: int) -> Iterator[Dict[str, Any]]:
+        """
+        Page through a core API list endpoint requesting PartialObjectMetadataList, skipping model deserialization.
+
+        Args:
+            path (str): The API path of the list endpoint.
+            label_selector (str): Label selector to filter by, or None.
+            field_selector (str): Field selector to filter by, or None.
+            limit (int): The maximum number of objects to request per page.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of raw PartialObjectMetadata dictionaries.
+        """
+        continue_token = None
+        while True:
+            query_params = [("limit", limit)]
+            if label_selector:
+                query_params.append(("labelSelector", label_selector))
+            if field_selector:
+                query_params.append(("fieldSelector", field_selector))
+            if continue_token:
+                query_params.append(("continue", continue_token))
+            response = self.v1.api_client.call_api(
+                path,
+                "GET",
+                query_params=query_params,
+                header_params={"Accept": _PARTIAL_METADATA_ACCEPT},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+            )
+            page = json.loads(response.data)
+            yield from page.get("items", [])
+            continue_token = page.get("metadata", {}).get("continue")
+            if not continue_token:
+                break
 
     def create_pod(self, namespace: str, pod_manifest: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -44,7 +156,7 @@ class KubernetesClientHelper:
             Dict[str, Any]: The created pod object.
         """
         pod = self.v1.create_namespaced_pod(namespace, pod_manifest)
-        return pod.to_dict()
+        return _model_to_dict(pod)
 
     def delete_pod(self, namespace: str, pod_name: str) -> None:
         """
@@ -59,18 +171,55 @@ class KubernetesClientHelper:
         """
         self.v1.delete_namespaced_pod(pod_name, namespace)
 
-    def list_nodes(self) -> List[Dict[str, Any]]:
+    def list_nodes(self, label_selector: str = None, field_selector: str = None, metadata_only: bool = False) -> List[Dict[str, Any]]:
         """
-        List all nodes in the cluster.
+        List all nodes in the cluster, optionally filtered by label and field selectors.
 
         Args:
-            None
+            label_selector (str, optional): Only return nodes matching this label selector.
+            field_selector (str, optional): Only return nodes matching this field selector.
+            metadata_only (bool, optional): Only fetch each node's metadata (see iter_nodes).
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries representing the nodes.
         """
-        nodes = self.v1.list_node()
-        return [node.to_dict() for node in nodes.items]
+        return list(self.iter_nodes(label_selector=label_selector, field_selector=field_selector, metadata_only=metadata_only))
+
+    def iter_nodes(self,
+                   label_selector: str = None,
+                   field_selector: str = None,
+                   limit: int = 500,
+                   metadata_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all nodes in the cluster, requesting them from the API server one page at a time.
+        Selectors are applied server side. With metadata_only the server returns PartialObjectMetadata,
+        yielded as raw API dictionaries (camelCase keys) containing only "metadata".
+
+        Args:
+            label_selector (str, optional): Only return nodes matching this label selector.
+            field_selector (str, optional): Only return nodes matching this field selector.
+            limit (int): The maximum number of nodes to request per page.
+            metadata_only (bool, optional): Only fetch each node's metadata.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of dictionaries representing the nodes.
+        """
+        if metadata_only:
+            yield from self._iter_partial_metadata("/api/v1/nodes", label_selector, field_selector, limit)
+            return
+        continue_token = None
+        while True:
+            nodes = self.v1.list_node(
+                label_selector=label_selector,
+                field_selector=field_selector,
+                limit=limit,
+                _continue=continue_token,
+            )
+            for node in nodes.items:
+                yield _model_to_dict(node)
+            continue_token = nodes.metadata._continue
+            if not continue_token:
+                break
 
     def get_node(self, node_name: str) -> Dict[str, Any]:
         """
@@ -83,7 +232,7 @@ class KubernetesClientHelper:
             Dict[str, Any]: The node object.
         """
         node = self.v1.read_node(node_name)
-        return node.to_dict()
+        return _model_to_dict(node)
 
     def create_deployment(self, namespace: str, deployment_manifest: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -97,7 +246,7 @@ class KubernetesClientHelper:
             Dict[str, Any]: The created deployment object.
         """
         deployment = self.apps_v1.create_namespaced_deployment(namespace, deployment_manifest)
-        return deployment.to_dict()
+        return _model_to_dict(deployment)
 
     def delete_deployment(self, namespace: str, deployment_name: str) -> None:
         """
@@ -1,5 +1,13 @@
 from google.cloud import pubsub_v1
-from typing import List
+from google.cloud.pubsub_v1.types import BatchSettings, FlowControl
+from concurrent.futures import TimeoutError
+from functools import lru_cache
+from threading import Lock
+from typing import List, Iterable, Callable
+from auth import get_credentials
+import logging
+
+logger = logging.getLogger(__name__)
 
 class PubSubClientHelper:
     def __init__(self, project_id: str):
@@ -10,8 +18,33 @@ class PubSubClientHelper:
             project_id (str): The Google Cloud project ID.
         """
         self.project_id = project_id
-        self.publisher = pubsub_v1.PublisherClient()
-        self.subscriber = pubsub_v1.SubscriberClient()
+        self.publisher = pubsub_v1.PublisherClient(
+            batch_settings=BatchSettings(max_messages=1000, max_bytes=10 * 1024 * 1024, max_latency=0.05),
+            credentials=get_credentials(),
+        )
+        self._single_publisher = None
+        self._lock = Lock()
+        self.subscriber = pubsub_v1.SubscriberClient(credentials=get_credentials())
+        self._topic_path = lru_cache(maxsize=4096)(lambda topic_id: self.publisher.topic_path(self.project_id, topic_id))
+        self._subscription_path = lru_cache(maxsize=4096)(
+            lambda subscription_id: self.subscriber.subscription_path(self.project_id, subscription_id)
+        )
+
+    def _get_single_publisher(self) -> pubsub_v1.PublisherClient:
+        """
+        Get the publisher used by publish_message, creating it on first use.
+        A batch of one message is sent as soon as it is published, so single publishes never wait on max_latency.
+
+        Returns:
+            pubsub_v1.PublisherClient: The single message publisher.
+        """
+        with self._lock:
+            if self._single_publisher is None:
+                self._single_publisher = pubsub_v1.PublisherClient(
+                    batch_settings=BatchSettings(max_messages=1),
+                    credentials=get_credentials(),
+                )
+            return self._single_publisher
 
     def create_topic(self, topic_id: str) -> pubsub_v1.types.Topic:
         """
@@ -23,7 +56,7 @@ class PubSubClientHelper:
         Returns:
             pubsub_v1.types.Topic: The created topic object.
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
+        topic_path = self._topic_path(topic_id)
         topic = self.publisher.create_topic(request={"name": topic_path})
         return topic
 
@@ -37,12 +70,13 @@ class PubSubClientHelper:
         Returns:
             None
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
+        topic_path = self._topic_path(topic_id)
         self.publisher.delete_topic(request={"topic": topic_path})
 
     def publish_message(self, topic_id: str, message: str) -> str:
         """
         Publish a message to a topic within initialised project.
+        The message is sent immediately rather than waiting to be batched. Use publish_messages for bulk publishing.
 
         Args:
             topic_id (str): The ID of the topic to publish to.
@@ -51,11 +85,26 @@ class PubSubClientHelper:
         Returns:
             str: The message ID of the published message.
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
-        future = self.publisher.publish(topic_path, message.encode("utf-8"))
+        topic_path = self._topic_path(topic_id)
+        future = self._get_single_publisher().publish(topic_path, message.encode("utf-8"))
         message_id = future.result()
         return message_id
 
+    def publish_messages(self, topic_id: str, messages: Iterable[str]) -> List[str]:
+        """
+        Publish many messages to a topic within initialised project, letting the publisher batch them into fewer requests.
+
+        Args:
+            topic_id (str): The ID of the topic to publish to.
+            messages (Iterable[str]): The messages to publish.
+
+        Returns:
+            List[str]: The message IDs of the published messages, in the order given.
+        """
+        topic_path = self._topic_path(topic_id)
+        futures = [self.publisher.publish(topic_path, message.encode("utf-8")) for message in messages]
+        return [future.result() for future in futures]
+
     def create_subscription(self, topic_id: str, subscription_id: str) -> pubsub_v1.types.Subscription:
         """
         Create a new subscription to a topic within initialised project.
@@ -67,8 +116,8 @@ class PubSubClientHelper:
         Returns:
             pubsub_v1.types.Subscription: The created subscription object.
         """
-        topic_path = self.publisher.topic_path(self.project_id, topic_id)
-        subscription_path = self.subscriber.subscription_path(self.project_id, subscription_id)
+        topic_path = self._topic_path(topic_id)
+        subscription_path = self._subscription_path(subscription_id)
         subscription = self.subscriber.create_subscription(request={"name": subscription_path, "topic": topic_path})
         return subscription
 
@@ -82,7 +131,7 @@ class PubSubClientHelper:
         Returns:
             None
         """
-        subscription_path = self.subscriber.subscription_path(self.project_id, subscription_id)
+        subscription_path = self._subscription_path(subscription_id)
         self.subscriber.delete_subscription(request={"subscription": subscription_path})
 
     def pull_messages(self, subscription_id: str, max_messages: int = 10) -> List[str]:
@@ -96,9 +145,52 @@ class PubSubClientHelper:
         Returns:
             List[str]: A list of pulled messages.
         """
-        subscription_path = self.subscriber.subscription_path(self.project_id, subscription_id)
+        subscription_path = self._subscription_path(subscription_id)
         response = self.subscriber.pull(request={"subscription": subscription_path, "max_messages": max_messages})
         messages = [msg.message.data.decode("utf-8") for msg in response.received_messages]
         ack_ids = [msg.ack_id for msg in response.received_messages]
-        self.subscriber.acknowledge(request={"subscription": subscription_path, "ack_ids": ack_ids})
-        return messages
\ No newline at end of file
+        if ack_ids:
+            self.subscriber.acknowledge(request={"subscription": subscription_path, "ack_ids": ack_ids})
+        return messages
+
+    def stream_messages(self,
+                        subscription_id: str,
+                        callback: Callable[[str], None],
+                        max_messages: int = 1000,
+                        timeout: float = None) -> None:
+        """
+        Receive messages from a subscription within initialised project over a streaming pull, blocking until timeout.
+        Each message is acknowledged once callback returns. If callback raises, the error is logged, the message is
+        nacked for redelivery and the stream carries on with the next message.
+
+        Args:
+            subscription_id (str): The ID of the subscription to receive messages from.
+            callback (Callable[[str], None]): Function called with the data of each message.
+            max_messages (int): The maximum number of unacknowledged messages held at once.
+            timeout (float, optional): Seconds to listen for before stopping. If None, listens until cancelled.
+
+        Returns:
+            None
+        """
+        subscription_path = self._subscription_path(subscription_id)
+
+        def _handle(message: pubsub_v1.subscriber.message.Message) -> None:
+            try:
+                callback(message.data.decode("utf-8"))
+            except Exception:
+                logger.exception("Callback failed for message %s on %s, nacking", message.message_id, subscription_path)
+                message.nack()
+                return
+            message.ack()
+
+        streaming_pull_future = self.subscriber.subscribe(
+            subscription_path, callback=_handle, flow_control=FlowControl(max_messages=max_messages)
+        )
+        try:
+            streaming_pull_future.result(timeout=timeout)
+        except TimeoutError:
+            pass
+        finally:
+            # Always shut the stream down so no callbacks run after this method returns or raises
+            streaming_pull_future.cancel()
+            streaming_pull_future.result()
\ No newline at end of file
@@ -1,6 +1,22 @@
 from google.cloud import redis_v1
 from google.protobuf.duration_pb2 import Duration
-from typing import List, Dict, Any
+from google.protobuf.json_format import MessageToDict
+from typing import List, Dict, Any, Iterator
+from auth import get_credentials
+
+
+def _instance_to_dict(instance: redis_v1.Instance) -> Dict[str, Any]:
+    """
+    Convert an Instance message to a dictionary using the protobuf runtime directly.
+
+    Args:
+        instance (redis_v1.Instance): The instance message.
+
+    Returns:
+        Dict[str, Any]: The instance as a dictionary keyed by proto field names.
+    """
+    return MessageToDict(instance._pb, preserving_proto_field_name=True)
+
 
 class MemorystoreClientHelper:
     def __init__(self, project_id: str, location: str):
@@ -14,7 +30,7 @@ class MemorystoreClientHelper:
         Returns:
             None
         """
-        self.client = redis_v1.CloudRedisClient()
+        self.client = redis_v1.CloudRedisClient(credentials=get_credentials())
         self.parent = f"projects/{project_id}/locations/{location}"
 
     def create_instance(self, instance_id: str, tier: str, memory_size_gb: int) -> Dict[str, Any]:
@@ -34,7 +50,7 @@ class MemorystoreClientHelper:
             "memory_size_gb": memory_size_gb,
         }
         operation = self.client.create_instance(parent=self.parent, instance_id=instance_id, instance=instance)
-        return operation.result().to_dict()
+        return _instance_to_dict(operation.result())
 
     def delete_instance(self, instance_id: str) -> None:
         """
@@ -61,7 +77,7 @@ class MemorystoreClientHelper:
         """
         name = f"{self.parent}/instances/{instance_id}"
         instance = self.client.get_instance(name=name)
-        return instance.to_dict()
+        return _instance_to_dict(instance)
 
     def list_instances(self) -> List[Dict[str, Any]]:
         """
@@ -73,5 +89,17 @@ class MemorystoreClientHelper:
         Returns:
             List[Dict[str, Any]]: A list of instance objects.
         """
-        instances = self.client.list_instances(parent=self.parent)
-        return [instance.to_dict() for instance in instances]
\ No newline at end of file
+        return list(self.iter_instances())
+
+    def iter_instances(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all Memorystore instances in the specified location, fetching pages as they are consumed.
+
+        Args:
+            None
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of instance objects.
+        """
+        for instance in self.client.list_instances(parent=self.parent):
+            yield _instance_to_dict(instance)
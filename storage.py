@@ -1,6 +1,12 @@
 from google.cloud import storage, bigquery
-from typing import List, Dict, Any
+from google.cloud.storage import transfer_manager
+from typing import List, Dict, Any, Iterator
 import pandas as pd
+import os
+from auth import get_credentials, get_authorized_session
+
+# Files above this size are transferred as parallel chunks of the same size
+_CHUNK_SIZE = 32 * 1024 * 1024
 
 class GCSClientHelper:
     def __init__(self, project_id: str):
@@ -10,8 +16,8 @@ class GCSClientHelper:
         Args:
             project_id (str): The Google Cloud Project ID.
         """
-        self.storage_client = storage.Client(project=project_id)
-        self.bigquery_client = bigquery.Client(project=project_id)
+        self.storage_client = storage.Client(project=project_id, credentials=get_credentials(), _http=get_authorized_session())
+        self.bigquery_client = bigquery.Client(project=project_id, credentials=get_credentials(), _http=get_authorized_session())
 
     def create_bucket(self, bucket_name: str) -> storage.Bucket:
         """
@@ -36,40 +42,56 @@ class GCSClientHelper:
         Returns:
             None
         """
-        bucket = self.storage_client.get_bucket(bucket_name)
-        bucket.delete()
+        self.storage_client.bucket(bucket_name).delete()
 
-    def upload_blob(self, bucket_name: str, source_file_name: str, destination_blob_name: str) -> None:
+    def upload_blob(self, bucket_name: str, source_file_name: str, destination_blob_name: str, max_workers: int = 8) -> None:
         """
         Upload a file to a bucket in your initialised project.
+        Files larger than 32 MB are uploaded as parallel 32 MB chunks on a thread pool.
 
         Args:
             bucket_name (str): The name of the bucket.
             source_file_name (str): The path to the file to upload.
             destination_blob_name (str): The name of the destination blob.
+            max_workers (int, optional): The number of chunks to upload in parallel for large files.
 
         Returns:
             None
         """
-        bucket = self.storage_client.get_bucket(bucket_name)
+        bucket = self.storage_client.bucket(bucket_name)
         blob = bucket.blob(destination_blob_name)
-        blob.upload_from_filename(source_file_name)
+        if os.path.getsize(source_file_name) > _CHUNK_SIZE:
+            transfer_manager.upload_chunks_concurrently(
+                source_file_name, blob, chunk_size=_CHUNK_SIZE, max_workers=max_workers, worker_type=transfer_manager.THREAD
+            )
+        else:
+            blob.upload_from_filename(source_file_name)
 
-    def download_blob(self, bucket_name: str, source_blob_name: str, destination_file_name: str) -> None:
+    def download_blob(self, bucket_name: str, source_blob_name: str, destination_file_name: str, max_workers: int = 8) -> None:
         """
         Download a blob from a bucket within your initialised project to local file storage.
+        Blobs larger than 32 MB are downloaded as parallel 32 MB chunks on a thread pool.
 
         Args:
             bucket_name (str): The name of the bucket.
             source_blob_name (str): The name of the source blob.
             destination_file_name (str): The path to the file to download.
+            max_workers (int, optional): The number of chunks to download in parallel for large blobs.
 
         Returns:
             None
         """
-        bucket = self.storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(source_blob_name)
-        blob.download_to_filename(destination_file_name)
+        bucket = self.storage_client.bucket(bucket_name)
+        # One metadata request gives the size to choose the download path, and the generation the chunks pin to
+        blob = bucket.get_blob(source_blob_name)
+        if blob is None:
+            raise Exception(f"Blob gs://{bucket_name}/{source_blob_name} not found")
+        if blob.size > _CHUNK_SIZE:
+            transfer_manager.download_chunks_concurrently(
+                blob, destination_file_name, chunk_size=_CHUNK_SIZE, max_workers=max_workers, worker_type=transfer_manager.THREAD
+            )
+        else:
+            blob.download_to_filename(destination_file_name)
 
     def list_blobs(self, bucket_name: str) -> List[str]:
         """
@@ -81,9 +103,20 @@ class GCSClientHelper:
         Returns:
             List[str]: A list of blob names.
         """
-        bucket = self.storage_client.get_bucket(bucket_name)
-        blobs = bucket.list_blobs()
-        return [blob.name for blob in blobs]
+        return list(self.iter_blobs(bucket_name))
+
+    def iter_blobs(self, bucket_name: str) -> Iterator[str]:
+        """
+        Iterate over all blobs in a bucket in initialised project, fetching pages as they are consumed.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+
+        Returns:
+            Iterator[str]: An iterator of blob names.
+        """
+        for blob in self.storage_client.list_blobs(bucket_name):
+            yield blob.name
 
     def blob_to_bigquery_table(self, bucket_name: str, blob_name: str, table_id: str) -> None:
         """
@@ -105,6 +138,8 @@ class GCSClientHelper:
     def move_blob(self, bucket_name: str, blob_name: str, destination_bucket_name: str, destination_blob_name: str) -> None:
         """
         Move a blob from one bucket to another bucket within initialised project.
+        Moves within a bucket are a single atomic server side move. Moves between buckets copy the current generation of the blob
+        and then delete that same generation, so a concurrent overwrite of the source is never deleted.
 
         Args:
             bucket_name (str): The name of the source bucket.
@@ -115,8 +150,25 @@ class GCSClientHelper:
         Returns:
             None
         """
-        source_bucket = self.storage_client.get_bucket(bucket_name)
-        source_blob = source_bucket.blob(blob_name)
-        destination_bucket = self.storage_client.get_bucket(destination_bucket_name)
-        source_bucket.copy_blob(source_blob, destination_bucket, destination_blob_name)
-        source_blob.delete()
+        source_bucket = self.storage_client.bucket(bucket_name)
+        if bucket_name == destination_bucket_name:
+            source_bucket.move_blob(source_bucket.blob(blob_name), destination_blob_name)
+            return
+
+        source_blob = source_bucket.get_blob(blob_name)
+        if source_blob is None:
+            raise Exception(f"Blob gs://{bucket_name}/{blob_name} not found")
+        destination_bucket = self.storage_client.bucket(destination_bucket_name)
+        source_bucket.copy_blob(
+            source_blob,
+            destination_bucket,
+            destination_blob_name,
+            source_generation=source_blob.generation,
+        )
+        try:
+            source_blob.delete(if_generation_match=source_blob.generation)
+        except Exception as e:
+            raise Exception(
+                f"Copied gs://{bucket_name}/{blob_name} to gs://{destination_bucket_name}/{destination_blob_name} "
+                f"but failed to delete the source: {e}"
+            ) from e
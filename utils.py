@@ -1,10 +1,11 @@
 import zipfile
 from zipfile import ZipFile, is_zipfile
-import io, os
+import io, os, shutil
 
 class ZipExtractor:
     """
     A class to extract data from a zip file and save locally.
+    The zip is opened once on creation; call close() or use the extractor as a context manager to release it.
 
     Args:
         zip_object (BytesIO): name of gcp project
@@ -15,6 +16,20 @@ class ZipExtractor:
         self.zip_object = zip_object
         self.folder_file_path = folder_file_path
         assert self._check_is_zipfile() == True
+        self.zip_object.seek(0)
+        self._zf = ZipFile(self.zip_object, "r")
+
+    def __enter__(self) -> "ZipExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying ZipFile handle
+        """
+        self._zf.close()
 
     def _check_is_zipfile(self) -> bool:
         """Checks if a zip file object is actually a zip file object
@@ -31,6 +46,7 @@ class ZipExtractor:
     def unzip_object(self) -> io.BytesIO:
         """
         return Zip object with provided tools to create, read, write, append, and list a ZIP file
+        a new ZipFile is returned on each call, so the caller may close it without affecting this extractor
         Return:
             BytesIO: 
         """
@@ -57,10 +73,32 @@ class ZipExtractor:
         with open(file_name, "wb") as binary_file:
             binary_file.write(file_bytes)
 
+    def extract_all(self, target_dir: str = None) -> list:
+        """
+        Extract every file in the zip into a directory, streaming each member to disk in 1 MiB chunks
+        Args:
+            target_dir (str, optional): directory to extract into, defaults to folder_file_path
+        Return:
+            list: list of paths of the extracted files
+        """
+        target_dir = os.path.realpath(target_dir or self.folder_file_path)
+        extracted = []
+        for info in self._zf.infolist():
+            if info.is_dir():
+                continue
+            dst_path = os.path.realpath(os.path.join(target_dir, info.filename))
+            if os.path.commonpath([target_dir, dst_path]) != target_dir:
+                raise ValueError(f"Zip member {info.filename} would extract outside {target_dir}")
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            with self._zf.open(info) as src, open(dst_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            extracted.append(dst_path)
+        return extracted
+
     def list_extracted_files(self) -> list:
         """
         Extract and list extracted files
         Return:
             list: list of files within the zipfile
         """
-        return ZipFile(self.zip_object, "r").namelist()
\ No newline at end of file
+        return self._zf.namelist()
\ No newline at end of file